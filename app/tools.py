@@ -7,42 +7,251 @@ Reddit Analysis MCP 서버의 도구 모듈
 
 import logging
 import re
-from datetime import datetime
+import functools
+import inspect
 import time
 from collections import Counter, defaultdict
-import praw
-from textblob import TextBlob
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-import string
-import requests
-from bs4 import BeautifulSoup
-
-from .config import REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools.func import ttl_cache
+
+from . import config
 
 logger = logging.getLogger(__name__)
 
-# NLTK 리소스 초기화
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# praw, nltk, textblob, bs4, requests는 무거운 의존성이므로
+# 서버 시작 속도를 위해 실제로 필요한 도구가 처음 호출될 때 가져옵니다.
+
+@functools.lru_cache(maxsize=1)
+def _praw():
+    """praw 모듈을 지연 로드합니다."""
+    import praw
+    return praw
+
+@functools.lru_cache(maxsize=1)
+def _ensure_nltk():
+    """필요한 NLTK 리소스가 없으면 한 번만 다운로드합니다."""
+    import nltk
+    
+    for resource in ('corpora/stopwords', 'corpora/wordnet'):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(resource.split('/')[-1], quiet=True)
+
+@functools.lru_cache(maxsize=1)
+def _nlp():
+    """NLTK 리소스를 지연 초기화하여 (불용어, 원형화기)를 반환합니다."""
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+    
+    _ensure_nltk()
+    lemmatizer = WordNetLemmatizer()
+    lemmatizer.lemmatize("words")  # 워드넷을 미리 로드 (여러 스레드에서 동시에 지연 로드되지 않도록)
+    return frozenset(stopwords.words('english')), lemmatizer
+
+# 키워드 추출용 토크나이저 (소문자 3글자 이상 단어, 구두점 제외)
+_TOKEN_RE = re.compile(r"[a-z][a-z']{2,}")
+
+# 레딧 포스트 URL에서 포스트 ID 추출용 패턴
+_POST_ID_RE = re.compile(r'/comments/([a-z0-9]+)/', re.IGNORECASE)
+
+# 웹 페이지 텍스트 공백 정리용 패턴
+_INLINE_SPACE_RE = re.compile(r'[ \t]+')
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# 웹 페이지 텍스트 추출 시 파싱할 태그 (나머지 노드는 트리에 만들지 않음)
+_TEXT_TAGS = ['title', 'div', 'p', 'span']
+
+# 도구 인자 허용 값
+_SEARCH_TYPES = frozenset({"post", "subreddit"})
+_TIME_FILTERS = frozenset({"hour", "day", "week", "month", "year", "all"})
+_TREND_PERIODS = frozenset({"hour", "day", "week", "month", "year"})
+_COMMENT_SORTS = frozenset({"top", "best", "new", "controversial", "old", "qa"})
+
+def _format_timestamp(ts):
+    """UTC 타임스탬프를 'YYYY-MM-DD HH:MM:SS' 문자열로 변환합니다."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts))
+
+def _truncate(text, limit=300, suffix="..."):
+    """텍스트가 limit보다 길면 잘라서 suffix를 붙입니다."""
+    return text if len(text) <= limit else text[:limit] + suffix
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+@functools.lru_cache(maxsize=100_000)
+def _lem(word):
+    """단어 원형화 결과를 캐시합니다 (댓글 간 중복 단어가 많음)."""
+    return _nlp()[1].lemmatize(word)
+
+@functools.lru_cache(maxsize=1)
+def _sentiment_analyzer():
+    """TextBlob 패턴 감정 분석기를 지연 생성합니다."""
+    from textblob.sentiments import PatternAnalyzer
+    analyzer = PatternAnalyzer()
+    analyzer.analyze("good")  # 감정 사전을 미리 로드 (여러 스레드에서 동시에 지연 로드되지 않도록)
+    return analyzer
+
+def _score_sentiments(texts):
+    """여러 텍스트의 감정(polarity, subjectivity)을 한 번에 계산합니다."""
+    analyze = _sentiment_analyzer().analyze
+    return [analyze(text) for text in texts]
+
+# 레딧 API 클라이언트 (최초 사용 시 한 번만 생성하여 공유)
+_REDDIT = None
+_REDDIT_LOCK = threading.Lock()
+
+def _get_reddit():
+    """공유 레딧 API 인스턴스를 반환합니다. 최초 호출 시에만 생성합니다."""
+    global _REDDIT
+    if _REDDIT is None:
+        with _REDDIT_LOCK:
+            if _REDDIT is None:
+                cfg = config.CONFIG
+                _REDDIT = _praw().Reddit(
+                    client_id=cfg.client_id,
+                    client_secret=cfg.client_secret,
+                    user_agent=cfg.user_agent
+                )
+    return _REDDIT
+
+# 작업 스레드별 레딧 API 클라이언트 (praw 인스턴스는 스레드 간에 공유하지 않음)
+_THREAD_LOCAL = threading.local()
+
+def _thread_reddit():
+    """현재 스레드 전용 레딧 API 인스턴스를 반환합니다."""
+    reddit = getattr(_THREAD_LOCAL, "reddit", None)
+    if reddit is None:
+        cfg = config.CONFIG
+        reddit = _THREAD_LOCAL.reddit = _praw().Reddit(
+            client_id=cfg.client_id,
+            client_secret=cfg.client_secret,
+            user_agent=cfg.user_agent
+        )
+    return reddit
+
+@functools.lru_cache(maxsize=1)
+def _subreddit_executor():
+    """서브레딧 병렬 수집용 스레드 풀을 반환합니다 (스레드별 클라이언트 재사용을 위해 유지)."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="reddit-trends")
+
+def _analyze_subreddit(subreddit_name, time_period, limit):
+    """서브레딧의 인기 포스트를 수집하고 분석합니다.
+    
+    Returns:
+        (서브레딧 통계, 포스트 목록, 포스트별 제목 키워드 집합) 튜플
+    """
+    stop_words = _nlp()[0]
+    analyze_sentiment = _sentiment_analyzer().analyze
+    
+    posts = []
+    title_tokens = []
+    
+    try:
+        subreddit = _thread_reddit().subreddit(subreddit_name)
+        
+        # 서브레딧 통계 초기화
+        stats = {
+            "post_count": 0,
+            "total_score": 0,
+            "total_comments": 0,
+            "keywords": Counter(),
+            "sentiments": []
+        }
+        
+        # 인기 포스트 가져오기 (API 호출 간격은 praw가 레딧 API 제한에 맞춰 자체적으로 조정함)
+        for post in subreddit.top(time_filter=time_period, limit=limit):
+            # 포스트 정보 저장
+            posts.append({
+                "id": post.id,
+                "title": post.title,
+                "subreddit": post.subreddit.display_name,
+                "score": post.score,
+                "num_comments": post.num_comments,
+                "created_utc": _format_timestamp(post.created_utc),
+                "url": f"https://www.reddit.com{post.permalink}"
+            })
+            title_tokens.append(frozenset(_lem(word) for word in _TOKEN_RE.findall(post.title.lower())))
+            
+            # 서브레딧 통계 업데이트
+            stats["post_count"] += 1
+            stats["total_score"] += post.score
+            stats["total_comments"] += post.num_comments
+            
+            # 텍스트 분석
+            combined_text = post.title
+            if post.selftext:
+                combined_text += " " + post.selftext
+                
+            # 감정 분석
+            stats["sentiments"].append(analyze_sentiment(combined_text).polarity)
+            
+            # 키워드 추출
+            # 불용어 제거, 단어 원형화
+            stats["keywords"].update(
+                _lem(word) for word in _TOKEN_RE.findall(combined_text.lower())
+                if word not in stop_words
+            )
+        
+        # 서브레딧 감정 평균 계산
+        sentiments = stats["sentiments"]
+        stats["avg_sentiment"] = sum(sentiments) / len(sentiments) if sentiments else 0
+        
+        # 서브레딧 키워드 요약
+        stats["top_keywords"] = [
+            {"word": word, "count": count} 
+            for word, count in stats["keywords"].most_common(10)
+        ]
+        
+        return stats, posts, title_tokens
     
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+    except Exception as e:
+        return {"error": f"서브레딧 분석 중 오류 발생: {str(e)}"}, [], []
+
+@functools.lru_cache(maxsize=1)
+def _http_session():
+    """웹 페이지 요청용 공유 세션을 반환합니다 (연결 재사용)."""
+    import requests
+    return requests.Session()
 
-# NLTK 초기화
-stop_words = set(stopwords.words('english'))
-lemmatizer = WordNetLemmatizer()
+@ttl_cache(maxsize=128, ttl=60)
+def _fetch(url, user_agent):
+    """웹 페이지를 가져옵니다. 같은 요청은 60초 동안 캐시된 응답을 반환합니다."""
+    response = _http_session().get(url, headers={'User-Agent': user_agent}, timeout=10)
+    response.raise_for_status()  # HTTP 오류 체크 (오류 응답은 캐시되지 않음)
+    return response
+
+def _require_reddit_auth(fn):
+    """레딧 API 인증 정보가 없으면 도구를 실행하지 않고 오류를 반환하는 데코레이터"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        cfg = config.CONFIG
+        if not cfg.client_id or not cfg.client_secret:
+            return {
+                "status": "error",
+                "message": "레딧 API 인증 정보가 설정되어 있지 않습니다. 환경 변수에 REDDIT_CLIENT_ID와 REDDIT_CLIENT_SECRET을 설정해주세요."
+            }
+        return fn(*args, **kwargs)
+    return wrapper
+
+def _validate_choice(param, choices, message):
+    """인자 param의 값이 choices에 없으면 도구를 실행하지 않고 오류를 반환하는 데코레이터"""
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        default = signature.parameters[param].default
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if args:
+                value = signature.bind(*args, **kwargs).arguments.get(param, default)
+            else:
+                value = kwargs.get(param, default)
+            if value not in choices:
+                return {
+                    "status": "error",
+                    "message": message
+                }
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
 
 def register_tools(mcp):
     """MCP 서버에 Reddit 분석 도구를 등록합니다."""
@@ -59,21 +268,18 @@ def register_tools(mcp):
         Returns:
             웹 페이지의 내용 또는, 실패한 경우 오류 정보를 반환합니다
         """
+        import requests
+        from bs4 import BeautifulSoup, SoupStrainer
+        
         try:
-            # User-Agent 설정
-            headers = {
-                'User-Agent': user_agent or REDDIT_USER_AGENT
-            }
-            
             # 웹 페이지 가져오기
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()  # HTTP 오류 체크
+            response = _fetch(url, user_agent or config.CONFIG.user_agent)
             
             # 응답 콘텐츠 처리
             if extract_text:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer(_TEXT_TAGS))
                 
-                # 스크립트와 스타일 요소 제거
+                # 스크립트와 스타일 요소 제거 (div 등의 내부에 포함된 경우)
                 for script in soup(["script", "style"]):
                     script.extract()
                 
@@ -81,9 +287,7 @@ def register_tools(mcp):
                 text = soup.get_text(separator='\n')
                 
                 # 공백 정리
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = '\n'.join(chunk for chunk in chunks if chunk)
+                text = _LINE_BREAK_RE.sub('\n', _INLINE_SPACE_RE.sub(' ', text)).strip()
                 
                 # Reddit 특화 정보 추출 (제목, 포스트 내용, 댓글 등)
                 title = soup.find('title')
@@ -100,7 +304,7 @@ def register_tools(mcp):
                     "url": url,
                     "title": title_text,
                     "post_content": post_content,
-                    "full_text": text[:5000] + ("..." if len(text) > 5000 else ""),  # 텍스트가 너무 길면 자름
+                    "full_text": _truncate(text, 5000),  # 텍스트가 너무 길면 자름
                     "content_length": len(text),
                     "content_type": response.headers.get('Content-Type', ''),
                     "is_reddit_page": "reddit.com" in url
@@ -110,7 +314,7 @@ def register_tools(mcp):
                 return {
                     "status": "success",
                     "url": url,
-                    "html": response.text[:5000] + ("..." if len(response.text) > 5000 else ""),  # HTML이 너무 길면 자름
+                    "html": _truncate(response.text, 5000),  # HTML이 너무 길면 자름
                     "content_length": len(response.text),
                     "content_type": response.headers.get('Content-Type', ''),
                     "is_reddit_page": "reddit.com" in url
@@ -132,6 +336,11 @@ def register_tools(mcp):
             }
 
     @mcp.tool()
+    @_require_reddit_auth
+    @_validate_choice("search_type", _SEARCH_TYPES,
+                      "유효하지 않은 검색 유형입니다. 'post' 또는 'subreddit'을 사용하세요.")
+    @_validate_choice("time_filter", _TIME_FILTERS,
+                      "유효하지 않은 시간 필터입니다. 'hour', 'day', 'week', 'month', 'year', 'all' 중 하나를 사용하세요.")
     def search_reddit(query: str, search_type: str = "post", subreddit: str = None, time_filter: str = "month", limit: int = 20) -> dict:
         """레딧에서 키워드로 서브레딧 또는 포스트를 검색합니다
         
@@ -146,32 +355,8 @@ def register_tools(mcp):
             검색 결과 목록을 반환합니다
         """
         try:
-            if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
-                return {
-                    "status": "error",
-                    "message": "레딧 API 인증 정보가 설정되어 있지 않습니다. 환경 변수에 REDDIT_CLIENT_ID와 REDDIT_CLIENT_SECRET을 설정해주세요."
-                }
-            
-            # 유효한 검색 유형 확인
-            if search_type not in ["post", "subreddit"]:
-                return {
-                    "status": "error",
-                    "message": "유효하지 않은 검색 유형입니다. 'post' 또는 'subreddit'을 사용하세요."
-                }
-            
-            # 유효한 시간 필터 확인
-            if time_filter not in ["hour", "day", "week", "month", "year", "all"]:
-                return {
-                    "status": "error",
-                    "message": "유효하지 않은 시간 필터입니다. 'hour', 'day', 'week', 'month', 'year', 'all' 중 하나를 사용하세요."
-                }
-            
-            # 레딧 API 인스턴스 생성
-            reddit = praw.Reddit(
-                client_id=REDDIT_CLIENT_ID,
-                client_secret=REDDIT_CLIENT_SECRET,
-                user_agent=REDDIT_USER_AGENT
-            )
+            # 레딧 API 인스턴스 가져오기
+            reddit = _get_reddit()
             
             results = []
             
@@ -186,7 +371,7 @@ def register_tools(mcp):
                         "description": sr.public_description,
                         "subscribers": sr.subscribers,
                         "url": f"https://www.reddit.com{sr.url}",
-                        "created_utc": datetime.fromtimestamp(sr.created_utc).strftime("%Y-%m-%d %H:%M:%S"),
+                        "created_utc": _format_timestamp(sr.created_utc),
                         "is_nsfw": sr.over18
                     }
                     results.append(subreddit_data)
@@ -210,10 +395,10 @@ def register_tools(mcp):
                         "score": post.score,
                         "upvote_ratio": post.upvote_ratio,
                         "num_comments": post.num_comments,
-                        "created_utc": datetime.fromtimestamp(post.created_utc).strftime("%Y-%m-%d %H:%M:%S"),
+                        "created_utc": _format_timestamp(post.created_utc),
                         "url": f"https://www.reddit.com{post.permalink}",
                         "is_self": post.is_self,
-                        "selftext_preview": post.selftext[:300] + "..." if len(post.selftext) > 300 else post.selftext,
+                        "selftext_preview": _truncate(post.selftext),
                         "is_nsfw": post.over_18
                     }
                     results.append(post_data)
@@ -236,6 +421,9 @@ def register_tools(mcp):
             }
 
     @mcp.tool()
+    @_require_reddit_auth
+    @_validate_choice("comment_sort", _COMMENT_SORTS,
+                      "유효하지 않은 댓글 정렬 방식입니다. 'top', 'best', 'new', 'controversial', 'old', 'qa' 중 하나를 사용하세요.")
     def analyze_reddit_post(post_url: str, comment_sort: str = "top", comment_limit: int = 100) -> dict:
         """레딧 포스트의 댓글을 분석하여 인사이트를 제공합니다
         
@@ -248,29 +436,14 @@ def register_tools(mcp):
             포스트 정보와 댓글 분석 결과를 반환합니다
         """
         try:
-            if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
-                return {
-                    "status": "error",
-                    "message": "레딧 API 인증 정보가 설정되어 있지 않습니다. 환경 변수에 REDDIT_CLIENT_ID와 REDDIT_CLIENT_SECRET을 설정해주세요."
-                }
+            _ensure_nltk()
             
-            # 유효한 정렬 방식 확인
-            if comment_sort not in ["top", "best", "new", "controversial", "old", "qa"]:
-                return {
-                    "status": "error",
-                    "message": "유효하지 않은 댓글 정렬 방식입니다. 'top', 'best', 'new', 'controversial', 'old', 'qa' 중 하나를 사용하세요."
-                }
-            
-            # 레딧 API 인스턴스 생성
-            reddit = praw.Reddit(
-                client_id=REDDIT_CLIENT_ID,
-                client_secret=REDDIT_CLIENT_SECRET,
-                user_agent=REDDIT_USER_AGENT
-            )
+            # 레딧 API 인스턴스 가져오기
+            reddit = _get_reddit()
             
             # URL에서 포스트 ID 추출
             post_id = None
-            id_match = re.search(r'/comments/([a-z0-9]+)/', post_url, re.IGNORECASE)
+            id_match = _POST_ID_RE.search(post_url)
             if id_match:
                 post_id = id_match.group(1)
             else:
@@ -291,7 +464,7 @@ def register_tools(mcp):
                 "score": post.score,
                 "upvote_ratio": post.upvote_ratio,
                 "num_comments": post.num_comments,
-                "created_utc": datetime.fromtimestamp(post.created_utc).strftime("%Y-%m-%d %H:%M:%S"),
+                "created_utc": _format_timestamp(post.created_utc),
                 "selftext": post.selftext,
                 "url": f"https://www.reddit.com{post.permalink}",
                 "is_nsfw": post.over_18
@@ -301,20 +474,24 @@ def register_tools(mcp):
             post.comment_sort = comment_sort
             post.comments.replace_more(limit=10)  # 더보기 버튼 처리
             
+            stop_words = _nlp()[0]
+            
             comments = []
-            all_comment_text = ""
-            comment_sentiments = []
+            comment_tokens = []  # 댓글별 키워드 집합 (주제 할당용)
+            polarity_sum = 0.0
+            sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
             keywords = Counter()
             
+            # 삭제된 댓글 제외
+            valid_comments = [c for c in post.comments.list()[:comment_limit] if c.author]
+            
+            # 감정 분석 (전체 댓글을 한 번에 처리)
+            sentiments = _score_sentiments(c.body for c in valid_comments)
+            
             # 댓글 정보 추출 및 분석
-            for comment in post.comments.list()[:comment_limit]:
-                if not comment.author:
-                    continue  # 삭제된 댓글 건너뛰기
-                    
+            for comment, sentiment in zip(valid_comments, sentiments):
                 comment_text = comment.body
                 
-                # 감정 분석
-                sentiment = TextBlob(comment_text).sentiment
                 sentiment_label = "positive" if sentiment.polarity > 0.1 else "negative" if sentiment.polarity < -0.1 else "neutral"
                 
                 # 댓글 정보 저장
@@ -322,8 +499,8 @@ def register_tools(mcp):
                     "id": comment.id,
                     "author": str(comment.author),
                     "score": comment.score,
-                    "created_utc": datetime.fromtimestamp(comment.created_utc).strftime("%Y-%m-%d %H:%M:%S"),
-                    "text": comment_text[:300] + "..." if len(comment_text) > 300 else comment_text,
+                    "created_utc": _format_timestamp(comment.created_utc),
+                    "text": _truncate(comment_text),
                     "sentiment": {
                         "polarity": sentiment.polarity,
                         "subjectivity": sentiment.subjectivity,
@@ -332,58 +509,49 @@ def register_tools(mcp):
                 }
                 comments.append(comment_data)
                 
-                # 텍스트 분석을 위한 데이터 축적
-                all_comment_text += " " + comment_text
-                comment_sentiments.append(sentiment.polarity)
+                # 감정 분석 집계
+                polarity_sum += sentiment.polarity
+                sentiment_counts[sentiment_label] += 1
                 
                 # 키워드 추출
-                tokens = word_tokenize(comment_text.lower())
-                # 불용어 및 구두점 제거, 단어 원형화
-                filtered_tokens = [lemmatizer.lemmatize(word) for word in tokens 
-                                  if word not in stop_words and word not in string.punctuation
-                                  and len(word) > 2]
+                # 불용어 제거, 단어 원형화
+                filtered_tokens = [_lem(word) for word in _TOKEN_RE.findall(comment_text.lower())
+                                   if word not in stop_words]
                 keywords.update(filtered_tokens)
+                comment_tokens.append(frozenset(filtered_tokens))
             
             # 감정 분석 요약
-            avg_sentiment = sum(comment_sentiments) / len(comment_sentiments) if comment_sentiments else 0
-            sentiment_counts = {
-                "positive": sum(1 for s in comment_sentiments if s > 0.1),
-                "neutral": sum(1 for s in comment_sentiments if -0.1 <= s <= 0.1),
-                "negative": sum(1 for s in comment_sentiments if s < -0.1)
-            }
+            avg_sentiment = polarity_sum / len(comments) if comments else 0
             
             # 상위 키워드 추출
             top_keywords = [{"word": word, "count": count} for word, count in keywords.most_common(20)]
             
-            # 주제별 댓글 그룹화 (기본적인 구현)
-            topics = defaultdict(list)
-            for i, comment in enumerate(comments):
-                # 상위 키워드를 활용한 토픽 할당 (단순화된 방식)
-                assigned_topic = None
-                comment_text = comment["text"].lower()
-                
-                for kw in top_keywords[:10]:  # 상위 10개 키워드만 사용
-                    if kw["word"] in comment_text:
-                        assigned_topic = kw["word"]
-                        break
-                
-                if assigned_topic:
-                    topics[assigned_topic].append(i)  # 댓글 인덱스 저장
-            
-            # 주제별 댓글 요약
+            # 주제 분석 (주제당 최소 2개의 댓글이 필요하므로 댓글이 적거나 키워드가 없으면 생략)
             topic_summaries = []
-            for topic, comment_indices in topics.items():
-                if len(comment_indices) > 1:  # 최소 2개 이상의 댓글이 있는 주제만
-                    topic_comments = [comments[i] for i in comment_indices]
-                    avg_sentiment = sum(c["sentiment"]["polarity"] for c in topic_comments) / len(topic_comments)
+            if len(comments) >= 2 and top_keywords:
+                # 주제별 댓글 그룹화 (기본적인 구현)
+                topics = defaultdict(list)
+                topic_words = [kw["word"] for kw in top_keywords[:10]]  # 상위 10개 키워드만 사용
+                for i, tokens in enumerate(comment_tokens):
+                    # 상위 키워드를 활용한 토픽 할당 (단순화된 방식)
+                    assigned_topic = next((word for word in topic_words if word in tokens), None)
                     
-                    topic_summaries.append({
-                        "topic": topic,
-                        "comment_count": len(comment_indices),
-                        "avg_sentiment": avg_sentiment,
-                        "sentiment_label": "positive" if avg_sentiment > 0.1 else "negative" if avg_sentiment < -0.1 else "neutral",
-                        "sample_comments": [comments[i]["text"] for i in comment_indices[:3]]
-                    })
+                    if assigned_topic:
+                        topics[assigned_topic].append(i)  # 댓글 인덱스 저장
+                
+                # 주제별 댓글 요약
+                for topic, comment_indices in topics.items():
+                    if len(comment_indices) > 1:  # 최소 2개 이상의 댓글이 있는 주제만
+                        topic_comments = [comments[i] for i in comment_indices]
+                        topic_sentiment = sum(c["sentiment"]["polarity"] for c in topic_comments) / len(topic_comments)
+                        
+                        topic_summaries.append({
+                            "topic": topic,
+                            "comment_count": len(comment_indices),
+                            "avg_sentiment": topic_sentiment,
+                            "sentiment_label": "positive" if topic_sentiment > 0.1 else "negative" if topic_sentiment < -0.1 else "neutral",
+                            "sample_comments": [comments[i]["text"] for i in comment_indices[:3]]
+                        })
             
             return {
                 "status": "success",
@@ -409,6 +577,9 @@ def register_tools(mcp):
             }
 
     @mcp.tool()
+    @_require_reddit_auth
+    @_validate_choice("time_period", _TREND_PERIODS,
+                      "유효하지 않은 시간 기간입니다. 'hour', 'day', 'week', 'month', 'year' 중 하나를 사용하세요.")
     def analyze_reddit_trends(subreddits: list = None, time_period: str = "day", limit: int = 50) -> dict:
         """레딧의 인기 키워드 및 트렌드를 분석합니다
         
@@ -421,100 +592,28 @@ def register_tools(mcp):
             인기 키워드, 감정 분석, 트렌드 정보를 반환합니다
         """
         try:
-            if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
-                return {
-                    "status": "error",
-                    "message": "레딧 API 인증 정보가 설정되어 있지 않습니다. 환경 변수에 REDDIT_CLIENT_ID와 REDDIT_CLIENT_SECRET을 설정해주세요."
-                }
-            
-            # 유효한 시간 필터 확인
-            if time_period not in ["hour", "day", "week", "month", "year"]:
-                return {
-                    "status": "error",
-                    "message": "유효하지 않은 시간 기간입니다. 'hour', 'day', 'week', 'month', 'year' 중 하나를 사용하세요."
-                }
+            _ensure_nltk()
             
-            # 레딧 API 인스턴스 생성
-            reddit = praw.Reddit(
-                client_id=REDDIT_CLIENT_ID,
-                client_secret=REDDIT_CLIENT_SECRET,
-                user_agent=REDDIT_USER_AGENT
-            )
+            # 작업 스레드에서 동시에 초기화되지 않도록 분석 리소스를 미리 로드
+            _nlp()
+            _sentiment_analyzer()
             
             # 분석할 서브레딧 결정
             if not subreddits:
                 subreddits = ["all"]  # 기본값으로 r/all 사용
             
             all_posts = []
+            post_title_tokens = []  # all_posts와 같은 순서의 제목 키워드 집합 (주제 분류용)
             subreddit_stats = {}
             
-            # 각 서브레딧의 인기 포스트 수집
-            for subreddit_name in subreddits:
-                try:
-                    subreddit = reddit.subreddit(subreddit_name)
-                    
-                    # 서브레딧 통계 초기화
-                    subreddit_stats[subreddit_name] = {
-                        "post_count": 0,
-                        "total_score": 0,
-                        "total_comments": 0,
-                        "keywords": Counter(),
-                        "sentiments": []
-                    }
-                    
-                    # 인기 포스트 가져오기
-                    for post in getattr(subreddit, f"top")(time_filter=time_period, limit=limit):
-                        # 포스트 정보 저장
-                        post_data = {
-                            "id": post.id,
-                            "title": post.title,
-                            "subreddit": post.subreddit.display_name,
-                            "score": post.score,
-                            "num_comments": post.num_comments,
-                            "created_utc": datetime.fromtimestamp(post.created_utc).strftime("%Y-%m-%d %H:%M:%S"),
-                            "url": f"https://www.reddit.com{post.permalink}"
-                        }
-                        all_posts.append(post_data)
-                        
-                        # 서브레딧 통계 업데이트
-                        subreddit_stats[subreddit_name]["post_count"] += 1
-                        subreddit_stats[subreddit_name]["total_score"] += post.score
-                        subreddit_stats[subreddit_name]["total_comments"] += post.num_comments
-                        
-                        # 텍스트 분석
-                        combined_text = post.title
-                        if post.selftext:
-                            combined_text += " " + post.selftext
-                            
-                        # 감정 분석
-                        sentiment = TextBlob(combined_text).sentiment.polarity
-                        subreddit_stats[subreddit_name]["sentiments"].append(sentiment)
-                        
-                        # 키워드 추출
-                        tokens = word_tokenize(combined_text.lower())
-                        # 불용어 및 구두점 제거, 단어 원형화
-                        filtered_tokens = [lemmatizer.lemmatize(word) for word in tokens 
-                                          if word not in stop_words and word not in string.punctuation
-                                          and len(word) > 2]
-                        subreddit_stats[subreddit_name]["keywords"].update(filtered_tokens)
-                        
-                        # API 호출 간격 조정 (레딧 API 제한 준수)
-                        time.sleep(0.1)
-                    
-                    # 서브레딧 감정 평균 계산
-                    sentiments = subreddit_stats[subreddit_name]["sentiments"]
-                    subreddit_stats[subreddit_name]["avg_sentiment"] = sum(sentiments) / len(sentiments) if sentiments else 0
-                    
-                    # 서브레딧 키워드 요약
-                    subreddit_stats[subreddit_name]["top_keywords"] = [
-                        {"word": word, "count": count} 
-                        for word, count in subreddit_stats[subreddit_name]["keywords"].most_common(10)
-                    ]
-                    
-                except Exception as e:
-                    subreddit_stats[subreddit_name] = {
-                        "error": f"서브레딧 분석 중 오류 발생: {str(e)}"
-                    }
+            # 각 서브레딧의 인기 포스트를 병렬로 수집
+            results = _subreddit_executor().map(
+                lambda name: _analyze_subreddit(name, time_period, limit), subreddits
+            )
+            for subreddit_name, (stats, posts, title_tokens) in zip(subreddits, results):
+                subreddit_stats[subreddit_name] = stats
+                all_posts.extend(posts)
+                post_title_tokens.extend(title_tokens)
             
             # 전체 트렌드 분석
             all_keywords = Counter()
@@ -552,21 +651,21 @@ def register_tools(mcp):
             
             # 주제별 분류 (단순화된 구현)
             topics = defaultdict(list)
-            for keyword, _ in trending_keywords[:10]:  # 상위 10개 키워드를 주제로 사용
-                for post in all_posts:
-                    if keyword in post["title"].lower():
-                        topics[keyword].append(post["id"])
+            for kw in trending_keywords[:10]:  # 상위 10개 키워드를 주제로 사용
+                keyword = kw["word"]
+                for post, title_tokens in zip(all_posts, post_title_tokens):
+                    if keyword in title_tokens:
+                        topics[keyword].append(post)
             
             # 주제별 요약
             topic_summaries = []
-            for topic, post_ids in topics.items():
-                if len(post_ids) > 1:  # 최소 2개 이상의 포스트가 있는 주제만
-                    relevant_posts = [p for p in all_posts if p["id"] in post_ids]
+            for topic, relevant_posts in topics.items():
+                if len(relevant_posts) > 1:  # 최소 2개 이상의 포스트가 있는 주제만
                     avg_score = sum(p["score"] for p in relevant_posts) / len(relevant_posts)
                     
                     topic_summaries.append({
                         "topic": topic,
-                        "post_count": len(post_ids),
+                        "post_count": len(relevant_posts),
                         "avg_score": avg_score,
                         "sample_posts": [p["title"] for p in relevant_posts[:3]]
                     })